@@ -0,0 +1,89 @@
+"""Benchmark for the headless ways of running many Snake games.
+
+Every game steers its snake around the same square lap from the middle of the
+board, so no game ends early and each way of running them does the same number
+of moves. Run it with make bench, or with src on PYTHONPATH:
+
+    PYTHONPATH=src python benchmarks/bench_headless.py
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import batch_sim
+from fast_step import FastSnakeGame
+from game_logic import SnakeGame
+
+try:
+    import numba  # noqa: F401
+except ImportError:
+    numba = None
+
+WIDTH = 800
+HEIGHT = 600
+BLOCK_SIZE = 20
+
+# Ten cells right, down, left and up, which keeps the snake on a 40 by 30 board
+LAP = [(1, 0)] * 10 + [(0, 1)] * 10 + [(-1, 0)] * 10 + [(0, -1)] * 10
+
+
+def run_snake_games(n, ticks):
+    """Step n SnakeGame instances one tick at a time."""
+    games = [SnakeGame(WIDTH, HEIGHT, BLOCK_SIZE) for _ in range(n)]
+    for tick in range(ticks):
+        dx, dy = LAP[tick % len(LAP)]
+        direction = (dx * BLOCK_SIZE, dy * BLOCK_SIZE)
+        for game in games:
+            game.change_direction(direction)
+            game.move_snake()
+
+
+def run_fast_games(n, ticks):
+    """Play all the moves of n FastSnakeGame instances in one call each."""
+    moves = np.array([LAP[tick % len(LAP)] for tick in range(ticks)]) * BLOCK_SIZE
+    for _ in range(n):
+        FastSnakeGame(WIDTH, HEIGHT, BLOCK_SIZE).play(moves)
+
+
+def run_batch(n, ticks):
+    """Step a batch of n games with batch_sim."""
+    cols = WIDTH // BLOCK_SIZE
+    rows = HEIGHT // BLOCK_SIZE
+    rng = np.random.default_rng()
+    state = batch_sim.new_games(n, cols, rows, rng)
+    dirs = state[4]
+    alive = state[6]
+    for tick in range(ticks):
+        batch_sim.change_directions(dirs, np.tile(LAP[tick % len(LAP)], (n, 1)))
+        alive = batch_sim.step(*state[:6], alive, cols, rows, rng)
+
+
+def main():
+    """Time each runner for several batch sizes and print the cost per move."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+
+    runners = {"SnakeGame": run_snake_games, "batch_sim": run_batch}
+    if numba is not None:
+        run_fast_games(1, len(LAP))  # Compile outside the timed runs
+        runners["FastSnakeGame.play"] = run_fast_games
+    else:
+        print("Numba is not installed; skipping FastSnakeGame.play")
+
+    print(f"{'games':>6} " + " ".join(f"{name:>22}" for name in runners))
+    for n in args.games:
+        timings = []
+        for runner in runners.values():
+            start = time.perf_counter()
+            runner(n, args.ticks)
+            elapsed = time.perf_counter() - start
+            timings.append(f"{elapsed / (n * args.ticks) * 1e9:>14.0f} ns/move")
+        print(f"{n:>6} " + " ".join(timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Vectorized simulation of many independent Snake games.
+
+This module advances N games at once with NumPy array operations, for training,
+parameter sweeps and headless benchmarks where running SnakeGame one game at a time
+is too slow. It follows the same rules as the game_logic module but works in grid
+cells rather than pixels: a cell is numbered row by row as row * cols + col, as in
+SnakeGame._encode, and a direction is one of (1, 0), (-1, 0), (0, 1), (0, -1), or
+(0, 0) for a snake that has not started moving.
+
+The state of a batch is a set of arrays created by new_games:
+
+- bodies: int32 array of shape (N, cols * rows) holding each snake's cells as a ring
+  buffer; a snake occupies bodies[i, heads[i]], bodies[i, heads[i] + 1], ... for
+  lengths[i] segments, wrapping at the end of the row
+- heads: int64 array of shape (N,) holding the index of each snake's head in bodies
+- lengths: int64 array of shape (N,) holding each snake's number of segments
+- occupied: bool array of shape (N, cols * rows), True where a snake is
+- dirs: int32 array of shape (N, 2) holding each snake's direction
+- food: int64 array of shape (N,) holding each game's food cell, or -1 if none
+- alive: bool array of shape (N,), False once a game has ended
+
+A step only reads and writes a few cells per game, so its cost grows with the number
+of games and not with the board size. A game's score is its length minus one.
+"""
+
+import numpy as np
+
+# Random draws per game before falling back to scanning the board for free cells
+_FOOD_ATTEMPTS = 8
+
+
+def new_games(n, cols=40, rows=30, rng=None):
+    """Create the state for a batch of games in their initial state.
+
+    Each snake starts as a single segment in the middle of the board, stationary,
+    with food on a random free cell.
+
+    Args:
+        n (int): Number of games
+        cols (int, optional): Number of grid columns. Defaults to 40.
+        rows (int, optional): Number of grid rows. Defaults to 30.
+        rng (numpy.random.Generator, optional): Random generator for food placement.
+            Defaults to a new unseeded generator.
+
+    Returns:
+        tuple: (bodies, heads, lengths, occupied, dirs, food, alive) arrays as
+            described in the module docstring
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    cells = cols * rows
+    start = (rows // 2) * cols + cols // 2
+    bodies = np.zeros((n, cells), dtype=np.int32)
+    bodies[:, 0] = start
+    heads = np.zeros(n, dtype=np.int64)
+    lengths = np.ones(n, dtype=np.int64)
+    occupied = np.zeros((n, cells), dtype=bool)
+    occupied[:, start] = True
+    dirs = np.zeros((n, 2), dtype=np.int32)
+    food = np.full(n, -1, dtype=np.int64)
+    alive = np.ones(n, dtype=bool)
+    _place_food(occupied, food, np.arange(n), rng)
+    return bodies, heads, lengths, occupied, dirs, food, alive
+
+
+def snake_cells(bodies, heads, lengths, game):
+    """Return the cells of one game's snake.
+
+    Args:
+        bodies (numpy.ndarray): Snake ring buffers
+        heads (numpy.ndarray): Head indices
+        lengths (numpy.ndarray): Snake lengths
+        game (int): Index of the game
+
+    Returns:
+        numpy.ndarray: Encoded cells of the snake, head first
+    """
+    indices = (heads[game] + np.arange(lengths[game])) % bodies.shape[1]
+    return bodies[game, indices]
+
+
+def change_directions(dirs, new_dirs):
+    """Change the direction of every game, ignoring 180-degree turns.
+
+    Args:
+        dirs (numpy.ndarray): Current directions, updated in place
+        new_dirs (numpy.ndarray): Requested directions of shape (N, 2)
+    """
+    reverse = np.all(new_dirs == -dirs, axis=1) & np.any(dirs != 0, axis=1)
+    dirs[~reverse] = new_dirs[~reverse]
+
+
+def step(bodies, heads, lengths, occupied, dirs, food, alive, cols, rows, rng=None):
+    """Advance every live, moving game by one cell.
+
+    Snakes that run into a wall or their own body end their game. Snakes that
+    reach their food grow by one segment and get new food on a random free cell;
+    a snake that fills the whole board also ends its game.
+
+    Args:
+        bodies (numpy.ndarray): Snake ring buffers, updated in place
+        heads (numpy.ndarray): Head indices, updated in place
+        lengths (numpy.ndarray): Snake lengths, updated in place
+        occupied (numpy.ndarray): Snake cell flags, updated in place
+        dirs (numpy.ndarray): Snake directions
+        food (numpy.ndarray): Food cells, updated in place
+        alive (numpy.ndarray): Live game flags
+        cols (int): Number of grid columns
+        rows (int): Number of grid rows
+        rng (numpy.random.Generator, optional): Random generator for food placement.
+            Defaults to a new unseeded generator.
+
+    Returns:
+        numpy.ndarray: Updated live game flags
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    capacity = bodies.shape[1]
+    games = np.flatnonzero(alive & np.any(dirs != 0, axis=1))
+    head_idx = heads[games]
+    head = bodies[games, head_idx]
+    col = head % cols + dirs[games, 0]
+    row = head // cols + dirs[games, 1]
+    cell = row * cols + col
+
+    # Check for collisions with walls
+    in_bounds = (col >= 0) & (col < cols) & (row >= 0) & (row < rows)
+
+    # Check for collisions with self (the tail cell is about to be vacated)
+    tail = bodies[games, (head_idx + lengths[games] - 1) % capacity]
+    hits = occupied[games, np.where(in_bounds, cell, 0)] & (cell != tail)
+    crashed = ~in_bounds | hits
+    alive = alive.copy()
+    alive[games[crashed]] = False
+
+    moved = ~crashed
+    games = games[moved]
+    cell = cell[moved]
+    tail = tail[moved]
+    grew = cell == food[games]
+
+    # Free the old tail of the snakes that did not grow before adding the new
+    # heads, since a head may move into the cell its tail just left
+    occupied[games[~grew], tail[~grew]] = False
+    head_idx = (head_idx[moved] - 1) % capacity
+    heads[games] = head_idx
+    bodies[games, head_idx] = cell
+    occupied[games, cell] = True
+
+    # A snake covering the whole board has nowhere left for food
+    eaten = games[grew]
+    lengths[eaten] += 1
+    full = lengths[eaten] == capacity
+    food[eaten[full]] = -1
+    alive[eaten[full]] = False
+    _place_food(occupied, food, eaten[~full], rng)
+    return alive
+
+
+def _place_food(occupied, food, games, rng):
+    """Place food on a random free cell for the selected games.
+
+    Candidate cells are drawn for all pending games at once and redrawn only for
+    the games whose candidate landed on the snake. Games still without food after
+    a few draws, whose snakes nearly fill the board, pick from their free cells.
+
+    Args:
+        occupied (numpy.ndarray): Snake cell flags
+        food (numpy.ndarray): Food cells, updated in place
+        games (numpy.ndarray): Indices of the games that need new food
+        rng (numpy.random.Generator): Random generator for the food cells
+    """
+    pending = games
+    for _ in range(_FOOD_ATTEMPTS):
+        if not pending.size:
+            return
+        cells = rng.integers(0, occupied.shape[1], pending.size)
+        free = ~occupied[pending, cells]
+        food[pending[free]] = cells[free]
+        pending = pending[~free]
+
+    for game in pending:
+        free = np.flatnonzero(~occupied[game])
+        food[game] = free[rng.integers(free.size)]
@@ -0,0 +1,299 @@
+"""Compiled move loop for headless Snake games.
+
+This module provides pure functions that advance a snake using only integer arithmetic
+on NumPy arrays, and a SnakeGame subclass built on them. The functions are compiled with
+Numba when it is installed and run as plain Python otherwise.
+
+The speedup comes from FastSnakeGame.play, which runs a whole sequence of moves inside
+the compiled loop and only returns to Python when food is eaten. A single move_snake
+call costs about as much as SnakeGame's, since calling into compiled code outweighs
+the move itself, and without Numba every call is slower than SnakeGame's. NumPy is
+required; Numba is optional but needed for any gain.
+"""
+
+import random
+from collections import deque
+
+import numpy as np
+
+from game_logic import SnakeGame
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to the interpreted step
+
+    def njit(**options):
+        """Return the decorated function unchanged when Numba is unavailable."""
+        return lambda func: func
+
+
+# Results returned by step
+MOVED = 0
+GREW = 1
+GAME_OVER = 2
+
+
+@njit(cache=True)
+def step(body, occupied, head_idx, length, dx, dy, food, cols, rows):
+    """Advance a snake stored as a ring buffer of encoded cells by one cell.
+
+    Cells are numbered row by row as in SnakeGame._encode. The snake occupies
+    body[head_idx], body[head_idx + 1], ... for length segments, wrapping at the end
+    of the buffer, so the buffer must hold one slot per grid cell.
+
+    Args:
+        body (numpy.ndarray): int32 ring buffer of the snake's cells, head first
+        occupied (numpy.ndarray): uint8 flag per cell, 1 where the snake is
+        head_idx (int): Index of the head in body
+        length (int): Number of snake segments
+        dx (int): Column displacement of the move (-1, 0 or 1)
+        dy (int): Row displacement of the move (-1, 0 or 1)
+        food (int): Cell holding the food, or -1 if there is none
+        cols (int): Number of grid columns
+        rows (int): Number of grid rows
+
+    Returns:
+        tuple: (head_idx, length, result) after the move, where result is MOVED,
+            GREW or GAME_OVER. body and occupied are updated in place.
+    """
+    capacity = body.shape[0]
+    head = body[head_idx]
+    col = head % cols + dx
+    row = head // cols + dy
+
+    # Check for collisions with walls
+    if col < 0 or col >= cols or row < 0 or row >= rows:
+        return head_idx, length, GAME_OVER
+
+    # Check for collisions with self (the tail cell is about to be vacated)
+    cell = row * cols + col
+    tail = body[(head_idx + length - 1) % capacity]
+    if occupied[cell] and cell != tail:
+        return head_idx, length, GAME_OVER
+
+    grew = cell == food
+    if not grew:
+        occupied[tail] = 0
+        length -= 1
+
+    head_idx = (head_idx - 1) % capacity
+    body[head_idx] = cell
+    occupied[cell] = 1
+    if grew:
+        return head_idx, length + 1, GREW
+    return head_idx, length + 1, MOVED
+
+
+@njit(cache=True)
+def run(body, occupied, head_idx, length, dx, dy, moves, food, cols, rows):
+    """Apply a sequence of direction changes, moving the snake after each one.
+
+    Each row of moves is handled like SnakeGame.change_direction followed by
+    move_snake: a 180-degree turn is ignored and a stationary snake stays put.
+    The loop stops early once the snake eats the food or the game ends, so the
+    caller can place new food or finish the game.
+
+    Args:
+        body (numpy.ndarray): int32 ring buffer of the snake's cells, as for step
+        occupied (numpy.ndarray): uint8 flag per cell, 1 where the snake is
+        head_idx (int): Index of the head in body
+        length (int): Number of snake segments
+        dx (int): Current column direction (-1, 0 or 1)
+        dy (int): Current row direction (-1, 0 or 1)
+        moves (numpy.ndarray): int32 array of shape (K, 2) holding the (dx, dy)
+            direction requested before each move
+        food (int): Cell holding the food, or -1 if there is none
+        cols (int): Number of grid columns
+        rows (int): Number of grid rows
+
+    Returns:
+        tuple: (head_idx, length, dx, dy, count, result), where count is the
+            number of moves applied and result is GREW or GAME_OVER if the loop
+            stopped early and MOVED otherwise
+    """
+    result = MOVED
+    count = 0
+    for i in range(moves.shape[0]):
+        # Prevent 180-degree turns; a stationary snake has no opposite
+        new_dx = moves[i, 0]
+        new_dy = moves[i, 1]
+        if (dx == 0 and dy == 0) or new_dx != -dx or new_dy != -dy:
+            dx = new_dx
+            dy = new_dy
+
+        count += 1
+        if dx == 0 and dy == 0:
+            continue
+        head_idx, length, result = step(
+            body, occupied, head_idx, length, dx, dy, food, cols, rows
+        )
+        if result != MOVED:
+            break
+    return head_idx, length, dx, dy, count, result
+
+
+class FastSnakeGame(SnakeGame):
+    """SnakeGame variant that keeps the snake in NumPy arrays for compiled moves.
+
+    The game rules are the same as SnakeGame, and play runs many moves at once
+    in compiled code for headless runs that rarely read the body. Unlike
+    SnakeGame, snake_pos and snake_set are new copies built on every access:
+    reading them is slow and changing them does not affect the game.
+    """
+
+    __slots__ = ("_body", "_occupied", "_head_idx", "_length")
+
+    def __init__(self, width=800, height=600, block_size=20):
+        """Initialize a new game instance.
+
+        Args:
+            width (int, optional): Width of game board. Defaults to 800.
+            height (int, optional): Height of game board. Defaults to 600.
+            block_size (int, optional): Size of game blocks. Defaults to 20.
+        """
+        cells = (width // block_size) * (height // block_size)
+        self._body = np.zeros(cells, dtype=np.int32)
+        self._occupied = np.zeros(cells, dtype=np.uint8)
+        self._head_idx = 0
+        self._length = 0
+        super().__init__(width, height, block_size)
+
+    @property
+    def snake_pos(self):
+        """deque: (x, y) positions of the snake segments, head first."""
+        capacity = self._body.shape[0]
+        indices = (self._head_idx + np.arange(self._length)) % capacity
+        return deque(self._decode(cell) for cell in self._body[indices].tolist())
+
+    @snake_pos.setter
+    def snake_pos(self, positions):
+        """Replace the snake body.
+
+        Args:
+            positions (iterable): (x, y) tuples for the new body, head first
+
+        Raises:
+            ValueError: If a position lies outside the board's grid
+        """
+        cells = self._body_cells(positions)
+        self._occupied[:] = 0
+        self._occupied[cells] = 1
+        self._body[: len(cells)] = cells
+        self._head_idx = 0
+        self._length = len(cells)
+
+    @property
+    def snake_set(self):
+        """set: Encoded grid cells occupied by the snake."""
+        return set(np.flatnonzero(self._occupied).tolist())
+
+    def generate_food(self):
+        """Generate new food at a random free cell.
+
+        Returns:
+            tuple: (x, y) coordinates of the new food position, or None if the
+                snake covers the whole board
+        """
+        free = np.flatnonzero(self._occupied == 0)
+        if free.size == 0:
+            return None
+        return self._decode(int(free[random.randrange(free.size)]))
+
+    def move_snake(self):
+        """Move the snake in its current direction.
+
+        Behaves like SnakeGame.move_snake, with the move itself done by step.
+        """
+        direction = self.direction
+        if direction == (0, 0):
+            return
+
+        bs = self.block_size
+        food = -1 if self.food_pos is None else self._encode(*self.food_pos)
+        self._head_idx, self._length, result = step(
+            self._body,
+            self._occupied,
+            self._head_idx,
+            self._length,
+            direction[0] // bs,
+            direction[1] // bs,
+            food,
+            self._cols,
+            self._rows,
+        )
+
+        if result == GAME_OVER:
+            self.game_over = True
+        elif result == GREW:
+            self.score += 1
+            self.food_pos = self.generate_food()
+            # No free cell left means the snake has filled the board
+            if self.food_pos is None:
+                self.game_over = True
+
+    def play(self, moves):
+        """Apply a sequence of direction changes, moving the snake after each one.
+
+        This has the same effect as calling change_direction(move) and then
+        move_snake() for each move, stopping once the game is over. The moves run
+        in the compiled loop, which only returns to Python to place new food.
+
+        Args:
+            moves (sequence): (x, y) directions in pixels, one per move
+
+        Returns:
+            int: Number of moves applied
+        """
+        bs = self.block_size
+        moves = np.asarray(moves, dtype=np.int32).reshape(-1, 2) // np.int32(bs)
+        dx = self.direction[0] // bs
+        dy = self.direction[1] // bs
+        applied = 0
+        while applied < len(moves) and not self.game_over:
+            food = -1 if self.food_pos is None else self._encode(*self.food_pos)
+            self._head_idx, self._length, dx, dy, count, result = run(
+                self._body,
+                self._occupied,
+                self._head_idx,
+                self._length,
+                dx,
+                dy,
+                moves[applied:],
+                food,
+                self._cols,
+                self._rows,
+            )
+            applied += count
+
+            if result == GAME_OVER:
+                self.game_over = True
+            elif result == GREW:
+                self.score += 1
+                self.food_pos = self.generate_food()
+                # No free cell left means the snake has filled the board
+                if self.food_pos is None:
+                    self.game_over = True
+
+        self.direction = (int(dx) * bs, int(dy) * bs)
+        return applied
+
+    def check_collision(self, position):
+        """Check if a position collides with walls or snake body.
+
+        Args:
+            position (tuple): Position to check as (x, y)
+
+        Returns:
+            bool: True if collision detected, False otherwise
+        """
+        # Check wall collision, treating a partial edge row or column as wall
+        bs = self.block_size
+        col = position[0] // bs
+        row = position[1] // bs
+        if not (0 <= col < self._cols and 0 <= row < self._rows):
+            return True
+
+        # Check self collision (excluding the tail, which moves away next tick)
+        tail = self._body[(self._head_idx + self._length - 1) % self._body.shape[0]]
+        cell = row * self._cols + col
+        return bool(self._occupied[cell]) and cell != tail
@@ -5,6 +5,13 @@ collision detection, food generation, and score tracking. It is designed to be i
 of any specific UI implementation.
 """
 
+import functools
+import random
+import textwrap
+import types
+from collections import deque
+
+
 class SnakeGame:
     """Main game logic class for the Snake game.
 
@@ -18,11 +25,35 @@ class SnakeGame:
         block_size (int): Size of each snake segment and food block in pixels
         game_over (bool): Flag indicating if the game has ended
         score (int): Current game score
-        snake_pos (list): List of (x, y) tuples representing snake segments
+        snake_pos (deque): Deque of (x, y) tuples representing snake segments
+        snake_set (set): Set of the grid cells occupied by the snake, encoded as
+            ints by _encode and kept in sync with snake_pos for constant-time
+            membership tests
         direction (tuple): Current movement direction as (x, y)
         food_pos (tuple): Current food position as (x, y)
     """
 
+    # Slots replace the per-instance __dict__ and make attribute access a fixed
+    # offset lookup; snake_pos itself is a property over _snake_pos
+    __slots__ = (
+        "width",
+        "height",
+        "block_size",
+        "game_over",
+        "score",
+        "_snake_pos",
+        "snake_set",
+        "direction",
+        "food_pos",
+        "_cols",
+        "_rows",
+        "_opposite",
+        "_free_cells",
+        "_free_index",
+        "_state",
+        "_state_view",
+    )
+
     def __init__(self, width=800, height=600, block_size=20):
         """Initialize a new game instance.
 
@@ -34,6 +65,19 @@ class SnakeGame:
         self.width = width
         self.height = height
         self.block_size = block_size
+        # Number of grid cells along each axis
+        self._cols = width // block_size
+        self._rows = height // block_size
+        # Opposite of each movement direction, used to reject 180-degree turns
+        self._opposite = {
+            (block_size, 0): (-block_size, 0),
+            (-block_size, 0): (block_size, 0),
+            (0, block_size): (0, -block_size),
+            (0, -block_size): (0, block_size),
+        }
+        # State returned by get_state, refreshed in place on each call
+        self._state = {}
+        self._state_view = types.MappingProxyType(self._state)
         self.reset_game()
 
     def reset_game(self):
@@ -52,40 +96,125 @@ class SnakeGame:
         self.direction = (0, 0)
         self.food_pos = self.generate_food()
 
+    @property
+    def snake_pos(self):
+        """deque: (x, y) positions of the snake segments, head first."""
+        return self._snake_pos
+
+    @snake_pos.setter
+    def snake_pos(self, positions):
+        """Replace the snake body and rebuild the occupancy tracking to match.
+
+        Args:
+            positions (iterable): (x, y) tuples for the new body, head first
+
+        Raises:
+            ValueError: If a position lies outside the board's grid
+        """
+        self._snake_pos = deque(positions)
+        self.snake_set = set(self._body_cells(self._snake_pos))
+        # Unoccupied grid cells, with each cell's index in the list (-1 when
+        # occupied) so a cell can be removed in constant time by swapping in
+        # the last entry
+        cells = self._cols * self._rows
+        self._free_cells = [cell for cell in range(cells) if cell not in self.snake_set]
+        self._free_index = [-1] * cells
+        for i, cell in enumerate(self._free_cells):
+            self._free_index[cell] = i
+
+    def _body_cells(self, positions):
+        """Encode snake positions, checking that each one lies on the grid.
+
+        Only cells on the grid can be tracked as occupied or free, so this keeps
+        positions outside it, including the partial row or column at the edge
+        of some boards, from reaching the free-cell list.
+
+        Args:
+            positions (iterable): (x, y) tuples to encode
+
+        Returns:
+            list: Cell number of each position
+
+        Raises:
+            ValueError: If a position lies outside the board's grid
+        """
+        bs = self.block_size
+        cells = []
+        for x, y in positions:
+            if not (0 <= x // bs < self._cols and 0 <= y // bs < self._rows):
+                raise ValueError(f"Snake position {(x, y)} is outside the board")
+            cells.append(self._encode(x, y))
+        return cells
+
+    def _encode(self, x, y):
+        """Encode a grid-aligned position as a single cell number.
+
+        Cells are numbered row by row, so hashing and comparing a cell is a
+        plain int operation rather than a tuple one.
+
+        Args:
+            x (int): X coordinate in pixels
+            y (int): Y coordinate in pixels
+
+        Returns:
+            int: Cell number in the range [0, columns * rows)
+        """
+        bs = self.block_size
+        return (y // bs) * self._cols + x // bs
+
+    def _decode(self, cell):
+        """Decode a cell number produced by _encode.
+
+        Args:
+            cell (int): Cell number
+
+        Returns:
+            tuple: (x, y) pixel coordinates of the cell
+        """
+        row, col = divmod(cell, self._cols)
+        return (col * self.block_size, row * self.block_size)
+
+    def _occupy(self, cell):
+        """Mark a grid cell as covered by the snake.
+
+        Args:
+            cell (int): Encoded cell the snake now covers
+        """
+        self.snake_set.add(cell)
+        free_index = self._free_index
+        index = free_index[cell]
+        if index >= 0:
+            free_index[cell] = -1
+            last = self._free_cells.pop()
+            if last != cell:
+                self._free_cells[index] = last
+                free_index[last] = index
+
+    def _vacate(self, cell):
+        """Mark a grid cell as no longer covered by the snake.
+
+        Args:
+            cell (int): Encoded cell the snake has left
+        """
+        self.snake_set.discard(cell)
+        if self._free_index[cell] < 0:
+            self._free_index[cell] = len(self._free_cells)
+            self._free_cells.append(cell)
+
     def generate_food(self):
         """Generate new food at a random position.
 
-        The food is placed at a random position on the game board, ensuring it doesn't
-        appear on top of the snake. The position is aligned to the block size grid.
+        The food is placed on a random free cell of the game board, so it never
+        appears on top of the snake. The position is aligned to the block size grid,
+        with every free cell equally likely.
 
         Returns:
-            tuple: (x, y) coordinates of the new food position
+            tuple: (x, y) coordinates of the new food position, or None if the
+                snake covers the whole board
         """
-        import random
-
-        x = (
-            round(random.randrange(0, self.width - self.block_size) / self.block_size)
-            * self.block_size
-        )
-        y = (
-            round(random.randrange(0, self.height - self.block_size) / self.block_size)
-            * self.block_size
-        )
-        # Ensure food doesn't appear on snake
-        while (x, y) in self.snake_pos:
-            x = (
-                round(
-                    random.randrange(0, self.width - self.block_size) / self.block_size
-                )
-                * self.block_size
-            )
-            y = (
-                round(
-                    random.randrange(0, self.height - self.block_size) / self.block_size
-                )
-                * self.block_size
-            )
-        return (x, y)
+        if not self._free_cells:
+            return None
+        return self._decode(random.choice(self._free_cells))
 
     def change_direction(self, new_direction):
         """Change the snake's direction of movement.
@@ -96,16 +225,8 @@ class SnakeGame:
         Args:
             new_direction (tuple): New direction as (x, y) displacement
         """
-        # Prevent 180-degree turns
-        opposite_directions = {
-            (self.block_size, 0): (-self.block_size, 0),
-            (-self.block_size, 0): (self.block_size, 0),
-            (0, self.block_size): (0, -self.block_size),
-            (0, -self.block_size): (0, self.block_size),
-        }
-        if self.direction == (0, 0) or new_direction != opposite_directions.get(
-            self.direction
-        ):
+        # Prevent 180-degree turns; a stationary snake has no opposite
+        if new_direction != self._opposite.get(self.direction):
             self.direction = new_direction
 
     def move_snake(self):
@@ -118,33 +239,52 @@ class SnakeGame:
         - Updating the score
         - Generating new food when current food is eaten
         """
-        if self.direction == (0, 0):
+        direction = self.direction
+        if direction == (0, 0):
+            return
+
+        # Bind the body to locals once; snake_pos is a property
+        snake_pos = self._snake_pos
+        head = snake_pos[0]
+        nx = head[0] + direction[0]
+        ny = head[1] + direction[1]
+
+        # Check for collisions with walls. The check works on grid cells, so a
+        # partial row or column left over at the board's edge counts as wall
+        bs = self.block_size
+        cols = self._cols
+        col = nx // bs
+        row = ny // bs
+        if not (0 <= col < cols and 0 <= row < self._rows):
+            self.game_over = True
             return
 
-        new_head = (
-            self.snake_pos[0][0] + self.direction[0],
-            self.snake_pos[0][1] + self.direction[1],
-        )
-
-        # Check for collisions with walls or self
-        if (
-            new_head[0] >= self.width
-            or new_head[0] < 0
-            or new_head[1] >= self.height
-            or new_head[1] < 0
-            or new_head in self.snake_pos[:-1]
-        ):
+        # Check for collisions with self (the tail cell is about to be vacated)
+        cell = row * cols + col
+        tail = snake_pos[-1]
+        tail_cell = (tail[1] // bs) * cols + tail[0] // bs
+        if cell in self.snake_set and cell != tail_cell:
             self.game_over = True
             return
 
-        self.snake_pos.insert(0, new_head)
+        new_head = (nx, ny)
+        ate_food = new_head == self.food_pos
+        if not ate_food:
+            # Vacate the tail before adding the head so that following the
+            # tail into its old cell keeps that cell marked as occupied
+            snake_pos.pop()
+            self._vacate(tail_cell)
+
+        snake_pos.appendleft(new_head)
+        self._occupy(cell)
 
         # Check if snake ate food
-        if new_head == self.food_pos:
+        if ate_food:
             self.score += 1
             self.food_pos = self.generate_food()
-        else:
-            self.snake_pos.pop()
+            # No free cell left means the snake has filled the board
+            if self.food_pos is None:
+                self.game_over = True
 
     def check_collision(self, position):
         """Check if a position collides with walls or snake body.
@@ -155,17 +295,16 @@ class SnakeGame:
         Returns:
             bool: True if collision detected, False otherwise
         """
-        # Check wall collision
-        if (
-            position[0] >= self.width
-            or position[0] < 0
-            or position[1] >= self.height
-            or position[1] < 0
-        ):
+        # Check wall collision, treating a partial edge row or column as wall
+        bs = self.block_size
+        col = position[0] // bs
+        row = position[1] // bs
+        if not (0 <= col < self._cols and 0 <= row < self._rows):
             return True
 
-        # Check self collision (excluding head)
-        if position in self.snake_pos[:-1]:
+        # Check self collision (excluding the tail, which moves away next tick)
+        cell = row * self._cols + col
+        if cell in self.snake_set and position != self._snake_pos[-1]:
             return True
 
         return False
@@ -173,16 +312,114 @@ class SnakeGame:
     def get_state(self):
         """Get the current game state.
 
+        The same read-only mapping is returned by every call and is refreshed in
+        place, so no new dict is built per call.
+
         Returns:
-            dict: Current game state including:
-                - snake_positions: List of all snake segment positions
+            mappingproxy: Current game state including:
+                - snake_positions: Deque of all snake segment positions
                 - food_position: Current food position
                 - score: Current score
                 - game_over: Whether the game has ended
         """
-        return {
-            "snake_positions": self.snake_pos,
-            "food_position": self.food_pos,
-            "score": self.score,
-            "game_over": self.game_over,
-        }
+        state = self._state
+        state["snake_positions"] = self.snake_pos
+        state["food_position"] = self.food_pos
+        state["score"] = self.score
+        state["game_over"] = self.game_over
+        return self._state_view
+
+
+# Source of a SnakeGame subclass for one board size. The grid dimensions are
+# written into move_snake as literals, so the hot bounds and cell arithmetic
+# load constants instead of reading instance attributes. The move follows
+# SnakeGame.move_snake exactly.
+_SPECIALIZED_GAME_TEMPLATE = textwrap.dedent(
+    """
+    class {name}(SnakeGame):
+        \"\"\"SnakeGame for a {width}x{height} board with {block_size} pixel blocks.\"\"\"
+
+        __slots__ = ()
+
+        def __init__(self):
+            SnakeGame.__init__(self, {width}, {height}, {block_size})
+
+        def move_snake(self):
+            direction = self.direction
+            if direction == (0, 0):
+                return
+
+            snake_pos = self._snake_pos
+            head = snake_pos[0]
+            nx = head[0] + direction[0]
+            ny = head[1] + direction[1]
+
+            col = nx // {block_size}
+            row = ny // {block_size}
+            if not (0 <= col < {cols} and 0 <= row < {rows}):
+                self.game_over = True
+                return
+
+            cell = row * {cols} + col
+            tail = snake_pos[-1]
+            tail_cell = (tail[1] // {block_size}) * {cols} + tail[0] // {block_size}
+            if cell in self.snake_set and cell != tail_cell:
+                self.game_over = True
+                return
+
+            new_head = (nx, ny)
+            ate_food = new_head == self.food_pos
+            if not ate_food:
+                snake_pos.pop()
+                self._vacate(tail_cell)
+
+            snake_pos.appendleft(new_head)
+            self._occupy(cell)
+
+            if ate_food:
+                self.score += 1
+                self.food_pos = self.generate_food()
+                if self.food_pos is None:
+                    self.game_over = True
+
+        move_snake.__doc__ = SnakeGame.move_snake.__doc__
+    """
+)
+
+
+def specialize(width=800, height=600, block_size=20):
+    """Create a SnakeGame subclass specialized for one board size.
+
+    The class is generated from a template with the board dimensions written into
+    its move_snake as constants, and is cached so each board size is only
+    generated once, however the arguments are passed. Instances are created
+    without arguments.
+
+    Args:
+        width (int, optional): Width of game board. Defaults to 800.
+        height (int, optional): Height of game board. Defaults to 600.
+        block_size (int, optional): Size of game blocks. Defaults to 20.
+
+    Returns:
+        type: SnakeGame subclass for the given board size
+    """
+    return _specialize(int(width), int(height), int(block_size))
+
+
+@functools.lru_cache(maxsize=None)
+def _specialize(width, height, block_size):
+    """Generate the specialized class for specialize, keyed by board size."""
+    name = f"SnakeGame_{width}_{height}_{block_size}"
+    source = _SPECIALIZED_GAME_TEMPLATE.format(
+        name=name,
+        width=width,
+        height=height,
+        block_size=block_size,
+        cols=width // block_size,
+        rows=height // block_size,
+    )
+    namespace = {"SnakeGame": SnakeGame}
+    exec(compile(source, f"<{name}>", "exec"), namespace)
+    cls = namespace[name]
+    cls.__module__ = __name__
+    return cls
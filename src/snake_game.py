@@ -7,7 +7,7 @@ mechanics to the game_logic module.
 
 import pygame
 import sys
-from game_logic import SnakeGame
+from game_logic import specialize
 
 # Initialize pygame
 pygame.init()
@@ -18,6 +18,23 @@ HEIGHT = 600
 BLOCK_SIZE = 20
 SNAKE_SPEED = 15
 
+# Arrow keys and the direction each one moves the snake in
+DIRECTIONS = {
+    pygame.K_LEFT: (-BLOCK_SIZE, 0),
+    pygame.K_RIGHT: (BLOCK_SIZE, 0),
+    pygame.K_UP: (0, -BLOCK_SIZE),
+    pygame.K_DOWN: (0, BLOCK_SIZE),
+}
+
+# Window events after which the window contents may be stale, so the next frame
+# has to redraw the whole board rather than just the changed cells
+REDRAW_EVENTS = {
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSHOWN,
+}
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -41,6 +58,8 @@ class SnakeGameUI:
         font_style (pygame.font.Font): Font for general messages
         score_font (pygame.font.Font): Font for score display
         game (SnakeGame): The game logic instance
+        score_rect (pygame.Rect): Screen area covered by the last score drawn
+        full_redraw (bool): Whether the next frame must redraw the whole board
     """
 
     def __init__(self):
@@ -51,17 +70,33 @@ class SnakeGameUI:
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Snake Game")
         self.clock = pygame.time.Clock()
+        # Mouse motion is never handled and can flood the event queue
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
         self.font_style = pygame.font.SysFont("bahnschrift", 25)
         self.score_font = pygame.font.SysFont("comicsansms", 35)
-        self.game = SnakeGame(WIDTH, HEIGHT, BLOCK_SIZE)
+        self.game = specialize(WIDTH, HEIGHT, BLOCK_SIZE)()
+        # Screen area covered by the score, updated whenever it is drawn
+        self.score_rect = pygame.Rect(0, 0, 0, 0)
+        self.full_redraw = True
+        # Rendered text is cached since font rendering is far slower than a blit,
+        # and converted to the display format so blits take SDL's fast path
+        self._score_value = None
+        self._score_surface = None
+        self._message_surfaces = {}
 
     def display_score(self):
         """Display the current score on the screen.
 
-        Renders the score in the top-left corner using the score font.
+        Renders the score in the top-left corner using the score font. The text is
+        only rendered again when the score has changed.
         """
-        value = self.score_font.render(f"Your Score: {self.game.score}", True, GREEN)
-        self.screen.blit(value, [0, 0])
+        score = self.game.score
+        if score != self._score_value:
+            self._score_surface = self.score_font.render(
+                f"Your Score: {score}", True, GREEN
+            ).convert_alpha()
+            self._score_value = score
+        self.score_rect = self.screen.blit(self._score_surface, [0, 0])
 
     def display_message(self, msg, color):
         """Display a message on the screen.
@@ -70,51 +105,93 @@ class SnakeGameUI:
             msg (str): Message to display
             color (tuple): RGB color tuple for the message
         """
-        mesg = self.font_style.render(msg, True, color)
+        mesg = self._message_surfaces.get((msg, color))
+        if mesg is None:
+            mesg = self.font_style.render(msg, True, color).convert_alpha()
+            self._message_surfaces[(msg, color)] = mesg
         self.screen.blit(mesg, [WIDTH / 6, HEIGHT / 3])
 
     def draw_snake(self):
         """Draw the snake on the screen.
 
-        Renders each segment of the snake as a black rectangle.
+        Renders each segment of the snake as a black rectangle. A single Rect is
+        moved between segments instead of building a new one per segment.
         """
-        for pos in self.game.snake_pos:
-            pygame.draw.rect(
-                self.screen, BLACK, [pos[0], pos[1], BLOCK_SIZE, BLOCK_SIZE]
-            )
+        rect = pygame.Rect(0, 0, BLOCK_SIZE, BLOCK_SIZE)
+        draw_rect = pygame.draw.rect
+        screen = self.screen
+        for x, y in self.game.snake_pos:
+            rect.x = x
+            rect.y = y
+            draw_rect(screen, BLACK, rect)
 
     def draw_food(self):
         """Draw the food on the screen.
 
-        Renders the food as a green rectangle.
+        Renders the food as a green rectangle. Nothing is drawn once the snake
+        has filled the board and no food is left.
+        """
+        if self.game.food_pos is None:
+            return
+        x, y = self.game.food_pos
+        pygame.draw.rect(self.screen, GREEN, (x, y, BLOCK_SIZE, BLOCK_SIZE))
+
+    def draw_frame(self):
+        """Redraw the whole board and push it to the display."""
+        self.screen.fill(WHITE)
+        self.draw_food()
+        self.draw_snake()
+        self.display_score()
+        pygame.display.update()
+
+    def draw_moved_cells(self, old_tail):
+        """Redraw only the cells changed by a move that did not eat food.
+
+        The vacated tail cell is cleared and the new head cell is filled, and
+        just those two cells are pushed to the display.
+
+        Args:
+            old_tail (tuple): (x, y) position of the tail before the move
+
+        Returns:
+            bool: False if the cells overlap the score and the whole board has
+                to be redrawn instead, True otherwise
         """
-        pygame.draw.rect(
-            self.screen,
-            GREEN,
-            [self.game.food_pos[0], self.game.food_pos[1], BLOCK_SIZE, BLOCK_SIZE],
-        )
+        head = self.game.snake_pos[0]
+        head_rect = pygame.Rect(head[0], head[1], BLOCK_SIZE, BLOCK_SIZE)
+        tail_rect = pygame.Rect(old_tail[0], old_tail[1], BLOCK_SIZE, BLOCK_SIZE)
+        if self.score_rect.colliderect(head_rect) or self.score_rect.colliderect(
+            tail_rect
+        ):
+            return False
+
+        # Clear the tail first in case the head moved into its cell
+        self.screen.fill(WHITE, tail_rect)
+        self.screen.fill(BLACK, head_rect)
+        pygame.display.update([tail_rect, head_rect])
+        return True
 
     def handle_input(self):
         """Handle user input events.
 
         Processes keyboard events for game control and window closing.
-        Arrow keys control snake direction.
+        Arrow keys control snake direction. Window events that may have left
+        the window stale request a full redraw.
 
         Returns:
             bool: False if the game should exit, True otherwise
         """
-        for event in pygame.event.get():
+        event = pygame.event.poll()
+        while event.type != pygame.NOEVENT:
             if event.type == pygame.QUIT:
                 return False
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_LEFT:
-                    self.game.change_direction((-BLOCK_SIZE, 0))
-                elif event.key == pygame.K_RIGHT:
-                    self.game.change_direction((BLOCK_SIZE, 0))
-                elif event.key == pygame.K_UP:
-                    self.game.change_direction((0, -BLOCK_SIZE))
-                elif event.key == pygame.K_DOWN:
-                    self.game.change_direction((0, BLOCK_SIZE))
+                direction = DIRECTIONS.get(event.key)
+                if direction is not None:
+                    self.game.change_direction(direction)
+            elif event.type in REDRAW_EVENTS:
+                self.full_redraw = True
+            event = pygame.event.poll()
         return True
 
     def game_loop(self):
@@ -127,6 +204,7 @@ class SnakeGameUI:
         - Managing game over state
         """
         running = True
+        self.full_redraw = True
         while running:
             if self.game.game_over:
                 self.screen.fill(BLUE)
@@ -134,25 +212,35 @@ class SnakeGameUI:
                 self.display_score()
                 pygame.display.update()
 
-                for event in pygame.event.get():
+                event = pygame.event.poll()
+                while event.type != pygame.NOEVENT:
                     if event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_q:
                             return
                         if event.key == pygame.K_c:
                             self.game.reset_game()
+                            self.full_redraw = True
                             break
                     if event.type == pygame.QUIT:
                         return
+                    event = pygame.event.poll()
+                # Limit the game over screen's frame rate instead of spinning
+                self.clock.tick(SNAKE_SPEED)
             else:
                 running = self.handle_input()
+                old_head = self.game.snake_pos[0]
+                old_tail = self.game.snake_pos[-1]
+                old_score = self.game.score
                 self.game.move_snake()
 
-                self.screen.fill(WHITE)
-                self.draw_food()
-                self.draw_snake()
-                self.display_score()
-
-                pygame.display.update()
+                # Eating food changes the score and the food cell, so redraw
+                # everything; a plain move only touches the head and tail cells
+                if self.full_redraw or self.game.score != old_score:
+                    self.draw_frame()
+                    self.full_redraw = False
+                elif self.game.snake_pos[0] != old_head:
+                    if not self.draw_moved_cells(old_tail):
+                        self.draw_frame()
                 self.clock.tick(SNAKE_SPEED)
 
 
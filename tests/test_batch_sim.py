@@ -0,0 +1,147 @@
+"""Test suite for the vectorized Snake simulation.
+
+This module tests that batch_sim advances many games at once following the
+same movement, collision, growth and food rules as the SnakeGame logic.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src import batch_sim  # noqa: E402
+
+
+def set_snake(bodies, heads, lengths, occupied, game, cells):
+    """Replace one game's snake with the given cells, head first."""
+    occupied[game] = False
+    occupied[game, cells] = True
+    bodies[game, : len(cells)] = cells
+    heads[game] = 0
+    lengths[game] = len(cells)
+
+
+class TestBatchSim:
+    """Test suite for the batch_sim module."""
+
+    @pytest.fixture
+    def rng(self):
+        """Fixture providing a seeded random generator.
+
+        Returns:
+            numpy.random.Generator: Generator seeded for repeatable food
+        """
+        return np.random.default_rng(0)
+
+    def test_new_games(self, rng):
+        """Test that new games start in the same state as SnakeGame.
+
+        Verifies:
+        - Every snake is a single stationary segment in the middle of the board
+        - Every game is alive with food on the board, off the snake
+        """
+        bodies, heads, lengths, occupied, dirs, food, alive = batch_sim.new_games(
+            8, rng=rng
+        )
+        middle = 15 * 40 + 20
+        for game in range(8):
+            assert batch_sim.snake_cells(bodies, heads, lengths, game).tolist() == [
+                middle
+            ]
+        assert occupied.sum(axis=1).tolist() == [1] * 8
+        assert occupied[:, middle].all()
+        assert not dirs.any()
+        assert alive.all()
+        assert np.all((food >= 0) & (food < 40 * 30))
+        assert not np.any(food == middle)
+
+    def test_movement_and_eating(self, rng):
+        """Test that moving games advance and grow onto food independently.
+
+        Verifies:
+        - Stationary games do not move
+        - A plain move keeps the length and frees the old tail
+        - Moving onto food grows the snake and places new food
+        """
+        state = batch_sim.new_games(3, rng=rng)
+        bodies, heads, lengths, occupied, dirs, food, alive = state
+        dirs[1] = (1, 0)
+        dirs[2] = (0, 1)
+        food[:2] = 0
+        food[2] = 16 * 40 + 20
+
+        alive = batch_sim.step(*state, 40, 30, rng)
+        assert alive.all()
+        cells = [batch_sim.snake_cells(bodies, heads, lengths, g) for g in range(3)]
+        assert cells[0].tolist() == [620]
+        assert cells[1].tolist() == [621]
+        assert cells[2].tolist() == [660, 620]
+        assert lengths.tolist() == [1, 1, 2]
+        assert np.flatnonzero(occupied[1]).tolist() == [621]
+        assert np.flatnonzero(occupied[2]).tolist() == [620, 660]
+        assert not occupied[2, food[2]]
+
+    def test_collisions(self, rng):
+        """Test wall and self collisions.
+
+        Verifies:
+        - Hitting a wall or the body ends only that game
+        - Following the tail into its vacated cell does not
+        """
+        state = batch_sim.new_games(3, rng=rng)
+        bodies, heads, lengths, occupied, dirs, food, alive = state
+        food[:] = 0
+        snake = [3 * 40 + 5, 4 * 40 + 5, 4 * 40 + 4, 3 * 40 + 4]
+        set_snake(bodies, heads, lengths, occupied, 0, [3 * 40 + 39, 3 * 40 + 38])
+        set_snake(bodies, heads, lengths, occupied, 1, snake)
+        set_snake(bodies, heads, lengths, occupied, 2, snake)
+        dirs[:] = [(1, 0), (0, 1), (-1, 0)]
+
+        alive = batch_sim.step(*state, 40, 30, rng)
+        assert alive.tolist() == [False, False, True]
+        assert (
+            batch_sim.snake_cells(bodies, heads, lengths, 2).tolist()
+            == [snake[3]] + snake[:3]
+        )
+        assert np.flatnonzero(occupied[2]).tolist() == sorted(snake)
+
+    def test_ring_buffer_wraps(self, rng):
+        """Test that a snake keeps its cells when its head wraps around the buffer."""
+        state = batch_sim.new_games(1, 4, 1, rng=rng)
+        bodies, heads, lengths, occupied, dirs, food, alive = state
+        set_snake(bodies, heads, lengths, occupied, 0, [0])
+        dirs[0] = (1, 0)
+
+        for expected in ([1, 0], [2, 1, 0]):
+            food[0] = expected[0]
+            alive = batch_sim.step(*state[:6], alive, 4, 1, rng)
+            assert batch_sim.snake_cells(bodies, heads, lengths, 0).tolist() == expected
+        assert heads[0] == 2
+        assert alive[0]
+
+    def test_change_directions(self):
+        """Test that 180-degree turns are ignored for moving snakes."""
+        dirs = np.array([(1, 0), (0, 0), (0, 1)], dtype=np.int32)
+        batch_sim.change_directions(dirs, np.array([(-1, 0), (-1, 0), (1, 0)]))
+        assert dirs.tolist() == [[1, 0], [-1, 0], [1, 0]]
+
+    def test_food_on_nearly_full_board(self, rng):
+        """Test food placement and game over when the board fills up.
+
+        Verifies:
+        - Food goes to the only free cell
+        - A snake filling the whole board ends its game and clears its food
+        """
+        state = batch_sim.new_games(1, 3, 1, rng=rng)
+        bodies, heads, lengths, occupied, dirs, food, alive = state
+        set_snake(bodies, heads, lengths, occupied, 0, [0])
+        food[0] = 1
+        dirs[0] = (1, 0)
+
+        alive = batch_sim.step(*state, 3, 1, rng)
+        assert alive[0]
+        assert food[0] == 2
+
+        alive = batch_sim.step(*state[:6], alive, 3, 1, rng)
+        assert not alive[0]
+        assert lengths[0] == 3
+        assert food[0] == -1
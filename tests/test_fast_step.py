@@ -0,0 +1,193 @@
+"""Test suite for the compiled Snake move step.
+
+This module tests the step and run functions and the FastSnakeGame class built on them,
+checking that they follow the same rules as the SnakeGame logic.
+"""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fast_step import GAME_OVER, GREW, MOVED, FastSnakeGame, run, step  # noqa: E402
+
+
+class TestStep:
+    """Test suite for the step function."""
+
+    def test_move_and_grow(self):
+        """Test that step moves the head and grows onto food.
+
+        Verifies:
+        - A plain move keeps the length and frees the old tail
+        - Moving onto food grows the snake by one segment
+        """
+        body = np.zeros(12, dtype=np.int32)
+        occupied = np.zeros(12, dtype=np.uint8)
+        body[0] = 5
+        occupied[5] = 1
+
+        head_idx, length, result = step(body, occupied, 0, 1, 1, 0, 7, 4, 3)
+        assert result == MOVED
+        assert length == 1
+        assert body[head_idx] == 6
+        assert occupied.tolist() == [0] * 6 + [1] + [0] * 5
+
+        head_idx, length, result = step(body, occupied, head_idx, length, 1, 0, 7, 4, 3)
+        assert result == GREW
+        assert length == 2
+        assert body[head_idx] == 7
+        assert occupied[6] and occupied[7]
+
+    def test_collisions(self):
+        """Test that step reports walls and body segments as game over.
+
+        Verifies:
+        - Moving into the body or off the board ends the game
+        - Moving into the cell the tail is vacating does not
+        """
+        body = np.zeros(12, dtype=np.int32)
+        occupied = np.zeros(12, dtype=np.uint8)
+        body[:4] = [5, 9, 8, 4]
+        occupied[[4, 5, 8, 9]] = 1
+
+        # Down from cell 5 runs into the body at cell 9
+        assert step(body, occupied, 0, 3, 0, 1, -1, 4, 3)[2] == GAME_OVER
+        # Left from cell 4 leaves the board
+        assert step(body, occupied, 3, 1, -1, 0, -1, 4, 3)[2] == GAME_OVER
+        # Left from cell 5 follows the tail into cell 4
+        assert step(body, occupied, 0, 4, -1, 0, -1, 4, 3)[2] == MOVED
+
+
+class TestRun:
+    """Test suite for the run function."""
+
+    def test_stops_on_food_and_ignores_reversal(self):
+        """Test that run applies a move sequence like change_direction and move_snake.
+
+        Verifies:
+        - A 180-degree turn is ignored and the snake keeps its direction
+        - The loop stops after the move that eats the food
+        """
+        body = np.zeros(12, dtype=np.int32)
+        occupied = np.zeros(12, dtype=np.uint8)
+        body[0] = 4
+        occupied[4] = 1
+        moves = np.array([[1, 0], [-1, 0], [0, 1], [1, 0]], dtype=np.int32)
+
+        head_idx, length, dx, dy, count, result = run(
+            body, occupied, 0, 1, 0, 0, moves, 10, 4, 3
+        )
+        assert (count, result) == (3, GREW)
+        assert (dx, dy) == (0, 1)
+        assert length == 2
+        assert body[head_idx] == 10
+
+    def test_stops_on_game_over(self):
+        """Test that run counts the crashing move and returns GAME_OVER."""
+        body = np.zeros(12, dtype=np.int32)
+        occupied = np.zeros(12, dtype=np.uint8)
+        body[0] = 6
+        occupied[6] = 1
+        moves = np.array([[1, 0]] * 5, dtype=np.int32)
+
+        head_idx, length, dx, dy, count, result = run(
+            body, occupied, 0, 1, 0, 0, moves, -1, 4, 3
+        )
+        assert (count, result) == (2, GAME_OVER)
+        assert body[head_idx] == 7
+
+
+class TestFastSnakeGame:
+    """Test suite for the FastSnakeGame class."""
+
+    @pytest.fixture
+    def game(self):
+        """Fixture providing a fresh FastSnakeGame instance for each test.
+
+        Returns:
+            FastSnakeGame: A new game instance with default settings
+        """
+        return FastSnakeGame(width=800, height=600, block_size=20)
+
+    def test_movement_and_eating(self, game):
+        """Test that the snake moves, eats and grows like in SnakeGame."""
+        initial_pos = game.snake_pos[0]
+        game.food_pos = (initial_pos[0] + 40, initial_pos[1])
+        game.change_direction((20, 0))
+        game.move_snake()
+        assert list(game.snake_pos) == [(initial_pos[0] + 20, initial_pos[1])]
+
+        game.move_snake()
+        assert len(game.snake_pos) == 2
+        assert game.score == 1
+        assert game.food_pos not in game.snake_pos
+
+    def test_self_collision(self, game):
+        """Test that the game ends when the snake runs into its body."""
+        game.snake_pos = [(100, 60), (100, 80), (80, 80), (80, 60), (100, 60)]
+        game.change_direction((0, 20))
+        game.move_snake()
+        assert game.game_over
+
+    def test_following_tail(self, game):
+        """Test that the snake may move into the cell its tail is vacating."""
+        game.snake_pos = [(100, 60), (100, 80), (80, 80), (80, 60)]
+        game.direction = (-20, 0)
+        assert not game.check_collision((80, 60))
+        game.move_snake()
+        assert not game.game_over
+        assert list(game.snake_pos) == [(80, 60), (100, 60), (100, 80), (80, 80)]
+
+    def test_wall_collision(self, game):
+        """Test that the game ends when the snake hits a wall."""
+        game.snake_pos = [(780, 300)]
+        game.change_direction((20, 0))
+        game.move_snake()
+        assert game.game_over
+
+    def test_food_on_nearly_full_board(self):
+        """Test food placement and game over when the board fills up."""
+        game = FastSnakeGame(width=40, height=40, block_size=20)
+        game.snake_pos = [(0, 0), (0, 20), (20, 20)]
+        assert game.generate_food() == (20, 0)
+
+        game.food_pos = (20, 0)
+        game.change_direction((20, 0))
+        game.move_snake()
+        assert game.food_pos is None
+        assert game.game_over
+
+    def test_play_matches_move_snake(self):
+        """Test that play has the same effect as moving one tick at a time.
+
+        Verifies:
+        - Snake, score, food and direction agree after a random move sequence
+        - play returns the number of moves made before the game ended
+        """
+        directions = [(20, 0), (-20, 0), (0, 20), (0, -20)]
+        scored = False
+        for seed in range(30):
+            moves = random.Random(seed).choices(directions, k=200)
+
+            random.seed(seed)
+            stepped = FastSnakeGame(width=120, height=120, block_size=20)
+            ticks = 0
+            for move in moves:
+                stepped.change_direction(move)
+                stepped.move_snake()
+                ticks += 1
+                if stepped.game_over:
+                    break
+
+            random.seed(seed)
+            played = FastSnakeGame(width=120, height=120, block_size=20)
+            assert played.play(moves) == ticks
+            assert list(played.snake_pos) == list(stepped.snake_pos)
+            assert played.score == stepped.score
+            assert played.food_pos == stepped.food_pos
+            assert played.direction == stepped.direction
+            assert played.game_over == stepped.game_over
+            scored = scored or played.score > 0
+        assert scored
@@ -6,7 +6,7 @@ game mechanics including movement, collisions, food generation, and scoring.
 """
 
 import pytest
-from src.game_logic import SnakeGame
+from src.game_logic import SnakeGame, specialize
 
 
 class TestSnakeGame:
@@ -16,13 +16,18 @@ class TestSnakeGame:
     organized by functionality and use pytest fixtures for setup.
     """
 
-    @pytest.fixture
-    def game(self):
+    @pytest.fixture(params=["generic", "specialized"])
+    def game(self, request):
         """Fixture providing a fresh SnakeGame instance for each test.
 
+        Every test runs against both the generic class and the class generated
+        by specialize for the same board size.
+
         Returns:
             SnakeGame: A new game instance with default settings
         """
+        if request.param == "specialized":
+            return specialize(800, 600, 20)()
         return SnakeGame(width=800, height=600, block_size=20)
 
     def test_initial_game_state(self, game):
@@ -84,6 +89,82 @@ class TestSnakeGame:
         game.move_snake()
         assert game.game_over
 
+    def test_following_tail(self, game):
+        """Test that the snake may move into the cell its tail is vacating.
+
+        Verifies:
+        - Moving onto the current tail cell does not end the game
+        - The occupancy set matches the snake body after the move
+        """
+        game.snake_pos = [(100, 60), (100, 80), (80, 80), (80, 60)]
+        game.direction = (-20, 0)  # Move left onto the tail at (80, 60)
+        game.move_snake()
+        assert not game.game_over
+        assert game.snake_pos[0] == (80, 60)
+        assert game.snake_set == {game._encode(x, y) for x, y in game.snake_pos}
+
+    def test_check_collision(self, game):
+        """Test collision queries against walls and the snake body.
+
+        Verifies:
+        - Positions off the board collide
+        - Body segments collide, except the tail which is about to move
+        - Free cells do not collide
+        """
+        game.snake_pos = [(100, 60), (100, 80), (80, 80)]
+        assert game.check_collision((-20, 60))
+        assert game.check_collision((100, game.height))
+        assert game.check_collision((100, 80))
+        assert not game.check_collision((80, 80))
+        assert not game.check_collision((120, 60))
+
+    @pytest.mark.parametrize("specialized", [False, True])
+    def test_partial_edge_cells(self, specialized):
+        """Test boards whose size is not a multiple of the block size.
+
+        Verifies:
+        - The partial row or column at the board's edge counts as wall
+        - Moves up to that edge keep the occupancy set in sync
+        """
+        for width, height, direction, moves in (
+            (800, 610, (0, 20), 14),
+            (810, 600, (20, 0), 19),
+        ):
+            if specialized:
+                game = specialize(width, height, 20)()
+            else:
+                game = SnakeGame(width, height, 20)
+            game.change_direction(direction)
+            for _ in range(moves):
+                game.move_snake()
+            assert not game.game_over
+            assert game.snake_set == {game._encode(x, y) for x, y in game.snake_pos}
+
+            game.move_snake()
+            assert game.game_over
+
+    def test_food_stays_on_grid(self):
+        """Test food placement when the snake starts off the block grid.
+
+        Verifies:
+        - Food is always grid-aligned, even after the snake has moved
+        - Snake positions outside the grid are rejected
+        """
+        game = SnakeGame(width=800, height=610, block_size=20)
+        assert game.snake_pos[0] == (400, 305)
+        game.change_direction((0, 20))
+        for _ in range(10):
+            game.move_snake()
+        for _ in range(200):
+            food_pos = game.generate_food()
+            assert food_pos[0] % game.block_size == 0
+            assert food_pos[1] % game.block_size == 0
+
+        with pytest.raises(ValueError):
+            game.snake_pos = [(400, 605)]
+        with pytest.raises(ValueError):
+            game.snake_pos = [(-20, 300)]
+
     def test_eating_food(self, game):
         """Test food eating mechanics.
 
@@ -142,6 +223,50 @@ class TestSnakeGame:
         assert game.direction == (0, 0)
         assert game.food_pos is not None
 
+    def test_get_state(self, game):
+        """Test the game state snapshot.
+
+        Verifies:
+        - The state reflects the current game values
+        - Repeated calls refresh and return the same read-only mapping
+        """
+        state = game.get_state()
+        assert state["score"] == 0
+        assert not state["game_over"]
+        assert list(state["snake_positions"]) == list(game.snake_pos)
+        assert state["food_position"] == game.food_pos
+
+        game.score = 3
+        assert game.get_state() is state
+        assert state["score"] == 3
+        with pytest.raises(TypeError):
+            state["score"] = 5
+
+    def test_slots(self, game):
+        """Test that game state lives in slots rather than an instance dict."""
+        assert not hasattr(game, "__dict__")
+        with pytest.raises(AttributeError):
+            game.speed = 2
+
+    def test_specialize(self):
+        """Test the generated board-size specialization.
+
+        Verifies:
+        - One class is generated and cached per board size, whether the
+          arguments are defaulted, positional or keywords
+        - Its instances are SnakeGames for that board size
+        """
+        cls = specialize(800, 600, 20)
+        assert specialize(800, 600, 20) is cls
+        assert specialize() is cls
+        assert specialize(width=800, height=600, block_size=20) is cls
+        assert specialize(800, block_size=20) is cls
+        assert isinstance(specialize()(), specialize(800, 600, 20))
+        assert specialize(400, 300, 20) is not cls
+        game = cls()
+        assert isinstance(game, SnakeGame)
+        assert (game.width, game.height, game.block_size) == (800, 600, 20)
+
     def test_food_generation(self, game):
         """Test food generation mechanics.
 
@@ -157,3 +282,21 @@ class TestSnakeGame:
             assert 0 <= food_pos[1] < game.height
             assert food_pos[0] % game.block_size == 0
             assert food_pos[1] % game.block_size == 0
+
+    def test_food_on_nearly_full_board(self):
+        """Test food placement when the snake covers most of the board.
+
+        Verifies:
+        - Food is placed on the only remaining free cell
+        - Filling the last free cell ends the game
+        """
+        game = SnakeGame(width=40, height=40, block_size=20)
+        game.snake_pos = [(0, 0), (0, 20), (20, 20)]
+        assert game.generate_food() == (20, 0)
+
+        game.food_pos = (20, 0)
+        game.change_direction((20, 0))
+        game.move_snake()
+        assert game.score == 1
+        assert game.food_pos is None
+        assert game.game_over